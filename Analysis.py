@@ -1,10 +1,40 @@
+import asyncio
+import html
+import json
 import logging
+import re
 from Scraper import StockScraper
 from Content import ContentGenerator
+from Cache import atomic_write
 import time
 
 logger = logging.getLogger(__name__)
 
+_WS_RE = re.compile(r'\s+')
+
+# stock_data entries holding JSON tables / free text scraped from the page
+TABLE_FIELDS = ("quarterly_results", "profit_and_loss", "balance_sheet", "cash_flow",
+                "debtors_ratio", "shareholding_pattern")
+TEXT_FIELDS = ("about", "key", "pros", "cons", "sector")
+
+def compact_stock_data(stock_data):
+    """
+    Shrink scraped stock data before it is put into the prompt: JSON tables are
+    decoded so they are not embedded as escaped strings, and free text has HTML
+    entities decoded and whitespace runs collapsed.
+
+    :param stock_data: Dictionary returned by StockScraper.get_stock_properties.
+    :return: Compact JSON string.
+    """
+    data = dict(stock_data)
+    for field in TABLE_FIELDS:
+        if data.get(field):
+            data[field] = json.loads(data[field])
+    for field in TEXT_FIELDS:
+        if data.get(field):
+            data[field] = _WS_RE.sub(' ', html.unescape(data[field])).strip()
+    return json.dumps(data, separators=(',', ':'), ensure_ascii=False)
+
 class StockAnalysisPipeline:
     """
     Orchestrates the entire process:
@@ -13,33 +43,137 @@ class StockAnalysisPipeline:
       3. Display or return results
     """
 
-    def __init__(self, company, genai, api_key, exchange="NSE"):
+    # Number of steps reported to progress callbacks
+    STEPS = 3
+
+    def __init__(self, company, genai=None, api_key=None, exchange="NSE", generator=None):
         """
         :param genai: The generative AI module to be used in content generation.
         :param api_key: The API key required by the generative AI service.
         :param exchange: The stock exchange symbol.
+        :param generator: Pre-built ContentGenerator; if given, genai and api_key are ignored.
         """
         self.stock = company.upper()
         self.scraper = StockScraper(company=self.stock, exchange=exchange)
-        self.generator = ContentGenerator(genai=genai, api_key=api_key)
+        self.generator = generator if generator is not None else ContentGenerator(genai=genai, api_key=api_key)
 
     def run_pipeline(self, progress_callback=None):
         """
         Execute the pipeline with a given company stock ticker or symbol and optional progress callback.
+
+        :return: The generated markdown report, or None on failure.
         """
-        logger.info("Starting stock analysis pipeline...")
-        steps = 3
+        prompt = self._scrape(progress_callback)
+        if prompt is None:
+            return
 
-        # Step 1: Scrape stock properties
-        stock_data = self.scraper.get_stock_properties()
-        if "error" in stock_data:
-            logger.error("Error scraping stock data. Pipeline will stop.")
+        # Step 2: Generate analysis content
+        analysis_result = self.generator.generate_content(prompt)
+        self._finish(analysis_result, progress_callback)
+        return analysis_result
+
+    def stream_pipeline(self, progress_callback=None):
+        """
+        Streaming variant of run_pipeline: yields the report as it is generated
+        and saves it once the model has finished. A stream that fails partway
+        is not saved.
+
+        :return: Iterator over chunks of the markdown report.
+        :raises GenerationError: If generation fails before the report is complete.
+        """
+        prompt = self._scrape(progress_callback)
+        if prompt is None:
             return
 
+        # Step 2: Stream analysis content
+        buffer = []
+        for chunk in self.generator.stream_content(prompt):
+            buffer.append(chunk)
+            yield chunk
+        self._finish("".join(buffer), progress_callback)
+
+    async def arun_pipeline(self, progress_callback=None):
+        """
+        Asynchronous variant of run_pipeline, so several pipelines can share one event loop.
+
+        :return: The generated markdown report, or None on failure.
+        """
+        # Scraping is blocking, so run it off the event loop
+        prompt = await asyncio.to_thread(self._scrape)
+        if prompt is None:
+            return
         if progress_callback:
-            progress_callback(1, steps)
+            progress_callback(1, self.STEPS)
 
         # Step 2: Generate analysis content
+        analysis_result = await self.generator.agenerate_content(prompt)
+        self._finish(analysis_result, progress_callback)
+        return analysis_result
+
+    @classmethod
+    async def run_batch(cls, companies, genai=None, api_key=None, exchange="NSE", generator=None):
+        """
+        Run the pipeline for several companies concurrently.
+
+        :param companies: Iterable of company symbols.
+        :return: List with the report (or None) of each pipeline, in input order.
+                 A pipeline that raises is logged and reported as None.
+        """
+        companies = list(companies)
+        try:
+            await asyncio.to_thread(StockScraper.prefetch_history, companies)
+        except Exception as e:
+            # Each pipeline falls back to downloading its own history
+            logger.warning("Prefetching price history failed: %s", e)
+        if generator is None:
+            generator = ContentGenerator(genai=genai, api_key=api_key)
+        pipelines = [cls(company=c, exchange=exchange, generator=generator) for c in companies]
+        results = await asyncio.gather(*[p.arun_pipeline() for p in pipelines], return_exceptions=True)
+
+        reports = []
+        for pipeline, result in zip(pipelines, results):
+            if isinstance(result, Exception):
+                logger.error("Pipeline for %s failed: %s", pipeline.stock, result, exc_info=result)
+                result = None
+            reports.append(result)
+        return reports
+
+    def _scrape(self, progress_callback=None):
+        """
+        Step 1: scrape the stock properties and build the report prompt from them.
+
+        :param progress_callback: Called with (1, STEPS) once the data is scraped.
+        :return: The prompt string, or None if scraping or prompt creation failed.
+        """
+        logger.info("Starting stock analysis pipeline for %s...", self.stock)
+        stock_data = self.scraper.get_stock_properties()
+        if "error" in stock_data:
+            logger.error("Error scraping stock data for %s. Pipeline will stop.", self.stock)
+            return None
+
+        if progress_callback:
+            progress_callback(1, self.STEPS)
+        return self._build_prompt(stock_data)
+
+    def _finish(self, analysis_result, progress_callback=None):
+        """
+        Steps 2 and 3: report the finished generation and save the markdown file.
+
+        :param analysis_result: The generated report, possibly empty.
+        :param progress_callback: Called with (2, STEPS) and (3, STEPS).
+        """
+        if progress_callback:
+            progress_callback(2, self.STEPS)
+        self._save_result(analysis_result)
+        if progress_callback:
+            progress_callback(3, self.STEPS)
+
+    def _build_prompt(self, stock_data):
+        """
+        Build the report prompt from scraped stock data.
+
+        :return: The prompt string, or None if it could not be created.
+        """
         try:
             prompt = (
                 "Generate an in-depth and actionable stock analysis report covering the following sections:\n\n"
@@ -50,29 +184,25 @@ class StockAnalysisPipeline:
                 "5. **Technical Analysis**: provide a visual rating based on voting given in technical analysis(e.g., in star format).\n"
                 "6. **Investment Recommendation**: Offer a clear recommendation (Buy, Sell, or Hold) for the next 3-6 months, supported by both technical and fundamental analysis insights.\n\n"
                 "Ensure the report is well-structured, jargon-free, and focuses on delivering actionable insights over raw data. Use the provided data as the basis for your analysis:\n"
-                f"**Company**: {stock_data}\n"
+                f"**Company**: {compact_stock_data(stock_data)}\n"
             )
             logger.info("Creating prompt for generative model.")
         except Exception as e:
             logger.error(f"Error creating prompt: {e}")
-            return
-        analysis_result = self.generator.generate_content(prompt)
+            return None
+        return prompt
 
-        if progress_callback:
-            progress_callback(2, steps)
+    def _save_result(self, analysis_result):
+        """
+        Write the generated analysis to <stock>_analysis.md, replacing any previous report atomically.
+        """
+        if not analysis_result:
+            logger.error("Stock analysis failed to generate content.")
+            return
 
-        # Step 3: Save markdown file
         file_path = f"{self.stock}_analysis.md"
-        with open(file_path, "w", encoding="utf-8") as f:
-            f.write(analysis_result)
-        
-        if progress_callback:
-            progress_callback(3, steps)
-        
-        if analysis_result:
-            logger.info("Analysis successfully generated.")
-        else:
-            logger.error("Stock analysis failed to generate content.")
+        atomic_write(file_path, analysis_result.encode("utf-8"))
+        logger.info("Analysis successfully generated.")
 
 # Example usage
 # if __name__ == "__main__":
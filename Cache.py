@@ -0,0 +1,188 @@
+import contextlib
+import hashlib
+import io
+import json
+import logging
+import os
+import tempfile
+import time
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+def _read_umask(default=0o022):
+    """
+    Read the process umask without changing it.
+
+    os.umask can only be queried by setting it, which briefly changes the mask
+    for every thread, so read it from /proc on Linux instead.
+
+    :param default: Mask assumed when /proc is unavailable.
+    :return: The process umask.
+    """
+    with contextlib.suppress(OSError, ValueError, IndexError):
+        with open("/proc/self/status", "r", encoding="ascii") as f:
+            for line in f:
+                if line.startswith("Umask:"):
+                    return int(line.split()[1], 8)
+    return default
+
+# Process umask, read once at import
+_UMASK = _read_umask()
+
+def atomic_write(path, data, buffer_size=1 << 20):
+    """
+    Write bytes to path in one buffered write and publish it atomically, so
+    readers never see a partially written file.
+
+    :param path: Destination file path.
+    :param data: Bytes to write.
+    :param buffer_size: Size of the write buffer in bytes.
+    """
+    tmp = tempfile.NamedTemporaryFile(mode="wb", buffering=buffer_size,
+                                      dir=os.path.dirname(path) or ".", delete=False)
+    try:
+        with tmp:
+            tmp.write(data)
+        # NamedTemporaryFile creates files as 0600; give the result the usual permissions
+        os.chmod(tmp.name, 0o666 & ~_UMASK)
+        os.replace(tmp.name, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp.name)
+        raise
+
+class FileCache:
+    """
+    Stores JSON-serializable payloads on disk with a per-lookup time-to-live.
+
+    Entries live under <root>/<ticker>/<endpoint>_<md5(params)>.json as
+    {"ts": <epoch seconds>, "payload": ...}. NumPy arrays are stored as .npy
+    files next to them and aged by their modification time.
+    """
+
+    def __init__(self, root=".cache"):
+        """
+        :param root: Directory under which cache entries are written.
+        """
+        self.root = root
+        self.hits = 0
+        self.misses = 0
+
+    def _path(self, key, ext=".json"):
+        """
+        Build the file path for a cache key.
+
+        :param key: Tuple of (ticker, endpoint) or (ticker, endpoint, params).
+        :param ext: File extension of the entry.
+        :return: Path of the cache file.
+        """
+        ticker, endpoint, *rest = key
+        params = rest[0] if rest else {}
+        digest = hashlib.md5(json.dumps(params, sort_keys=True).encode("utf-8")).hexdigest()
+        return os.path.join(self.root, ticker, f"{endpoint}_{digest}{ext}")
+
+    def _record(self, path, hit):
+        """Count and log a cache lookup."""
+        if hit:
+            self.hits += 1
+        else:
+            self.misses += 1
+        logger.info("Cache %s for %s (hits=%d, misses=%d)", "hit" if hit else "miss", path, self.hits, self.misses)
+
+    def get(self, key, ttl):
+        """
+        Return the cached payload for key if it is younger than ttl seconds.
+
+        :param key: Cache key, see _path.
+        :param ttl: Maximum age of the entry in seconds.
+        :return: Cached payload, or None on a miss.
+        """
+        return self.get_with_age(key, ttl)[0]
+
+    def get_with_age(self, key, ttl):
+        """
+        Like get, but also return how old the entry is.
+
+        :param key: Cache key, see _path.
+        :param ttl: Maximum age of the entry in seconds.
+        :return: Tuple of (payload, age in seconds), or (None, None) on a miss.
+        """
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            entry = None
+
+        age = time.time() - entry.get("ts", 0) if entry else None
+        hit = age is not None and age < ttl
+        self._record(path, hit)
+        return (entry["payload"], age) if hit else (None, None)
+
+    def set(self, key, payload):
+        """
+        Store payload under key, stamped with the current time.
+
+        :param key: Cache key, see _path.
+        :param payload: JSON-serializable value.
+        """
+        path = self._path(key)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            atomic_write(path, json.dumps({"ts": time.time(), "payload": payload}).encode("utf-8"))
+        except OSError as e:
+            logger.warning("Could not write cache entry %s: %s", path, e)
+
+    def get_array(self, key, ttl):
+        """
+        Return the cached NumPy array for key if it is younger than ttl seconds.
+
+        :param key: Cache key, see _path.
+        :param ttl: Maximum age of the entry in seconds.
+        :return: Cached array, or None on a miss.
+        """
+        path = self._path(key, ext=".npy")
+        try:
+            array = np.load(path) if time.time() - os.path.getmtime(path) < ttl else None
+        except (OSError, ValueError):
+            array = None
+
+        self._record(path, array is not None)
+        return array
+
+    def set_array(self, key, array):
+        """
+        Store a NumPy array under key.
+
+        :param key: Cache key, see _path.
+        :param array: Array to save.
+        """
+        path = self._path(key, ext=".npy")
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            buf = io.BytesIO()
+            np.save(buf, array)
+            atomic_write(path, buf.getvalue())
+        except OSError as e:
+            logger.warning("Could not write cache entry %s: %s", path, e)
+
+    def get_or_fetch(self, key, ttl, loader, array=False):
+        """
+        Return the cached payload for key, calling loader on a miss.
+
+        :param key: Cache key, see _path.
+        :param ttl: Maximum age of the entry in seconds.
+        :param loader: Zero-argument callable producing the payload. A result
+                       of None is returned as-is and not cached.
+        :param array: Store the payload as a NumPy array instead of JSON.
+        :return: Cached or freshly loaded payload.
+        """
+        get, put = (self.get_array, self.set_array) if array else (self.get, self.set)
+        payload = get(key, ttl)
+        if payload is None:
+            payload = loader()
+            if payload is not None:
+                put(key, payload)
+        return payload
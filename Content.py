@@ -1,24 +1,96 @@
+import asyncio
+import hashlib
 import logging
+import os
+import threading
 import time
+from functools import lru_cache
+from Cache import atomic_write
 
 logger = logging.getLogger(__name__)
 
+class GenerationError(Exception):
+    """Raised when a streamed generation fails before the response is complete."""
+
+@lru_cache(maxsize=4)
+def _get_model(genai, api_key, model_name):
+    """
+    Configure the SDK and build a model, reusing it for repeated arguments.
+
+    :param genai: A generative AI module or library.
+    :param api_key: API key for authentication with the generative model.
+    :param model_name: Model name to instantiate.
+    :return: The generative model instance.
+    """
+    genai.configure(api_key=api_key)
+    return genai.GenerativeModel(model_name)
+
+class _RateLimiter:
+    """
+    Spaces out requests so that consecutive calls start at least a given
+    interval apart, sleeping only when a call would come too early. The
+    interval is passed by each caller, since generators sharing the limiter
+    may use different request intervals.
+    """
+
+    def __init__(self):
+        self.next_allowed = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self, interval):
+        """
+        Block until the next request slot is available and reserve it.
+
+        :param interval: Seconds until the following slot.
+        """
+        delay = self._reserve(interval)
+        if delay > 0:
+            logger.info(f"Rate limit reached, waiting {delay:.1f}s before sending request.")
+            time.sleep(delay)
+
+    async def aacquire(self, interval):
+        """
+        Asynchronous variant of acquire that yields to the event loop while waiting.
+
+        :param interval: Seconds until the following slot.
+        """
+        delay = self._reserve(interval)
+        if delay > 0:
+            logger.info(f"Rate limit reached, waiting {delay:.1f}s before sending request.")
+            await asyncio.sleep(delay)
+
+    def _reserve(self, interval):
+        """Reserve the next slot and return how many seconds until it starts."""
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self.next_allowed)
+            self.next_allowed = start + interval
+        return start - now
+
 class ContentGenerator:
     """
     Responsible for generating content or analysis using a generative language model.
     """
 
-    def __init__(self, genai, api_key, model_name='gemini-1.5-pro', request_interval=40):
+    # Shared by all generators so the quota is respected across pipelines.
+    _RATE_LIMITER = _RateLimiter()
+
+    def __init__(self, genai, api_key, model_name='gemini-1.5-pro', request_interval=40,
+                 cache_dir=".cache/llm", cache_ttl=6 * 60 * 60):
         """
         :param genai: A generative AI module or library.
         :param api_key: API key for authentication with the generative model.
         :param model_name: Model name to use for generating content.
-        :param request_interval: Seconds to wait between requests to avoid rate limits.
+        :param request_interval: Minimum seconds between requests to avoid rate limits.
+        :param cache_dir: Directory for cached responses, or None to disable caching.
+        :param cache_ttl: Seconds a cached response stays valid.
         """
         self.genai = genai
         self.api_key = api_key
         self.model_name = model_name
         self.request_interval = request_interval
+        self.cache_dir = cache_dir
+        self.cache_ttl = cache_ttl
         self._configure_model()
 
     def _configure_model(self):
@@ -26,8 +98,42 @@ class ContentGenerator:
         if not self.api_key:
             logger.error("API key is required for ContentGenerator.")
             raise ValueError("API key is required.")
-        self.genai.configure(api_key=self.api_key)
-        self.model = self.genai.GenerativeModel(self.model_name)
+        self.model = _get_model(self.genai, self.api_key, self.model_name)
+
+    def _cache_path(self, prompt):
+        """Path of the cached response for a prompt."""
+        key = hashlib.blake2b(prompt.encode("utf-8"), digest_size=16).hexdigest()
+        return os.path.join(self.cache_dir, self.model_name.replace("/", "_"), f"{key}.txt")
+
+    def _cached_response(self, prompt):
+        """
+        Return the cached response for prompt if it is younger than cache_ttl.
+
+        :return: The cached text, or None if there is no fresh entry.
+        """
+        if not self.cache_dir:
+            return None
+        path = self._cache_path(prompt)
+        try:
+            if time.time() - os.path.getmtime(path) >= self.cache_ttl:
+                return None
+            with open(path, "r", encoding="utf-8") as f:
+                text = f.read()
+        except OSError:
+            return None
+        logger.info("Using cached response for prompt.")
+        return text
+
+    def _store_response(self, prompt, text):
+        """Cache a generated response for prompt."""
+        if not self.cache_dir or not text:
+            return
+        path = self._cache_path(prompt)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            atomic_write(path, text.encode("utf-8"))
+        except OSError as e:
+            logger.warning(f"Could not cache response: {e}")
 
     def generate_content(self, prompt):
         """
@@ -36,6 +142,11 @@ class ContentGenerator:
         :param prompt: A string prompt for the model.
         :return: The generated text, or None on failure.
         """
+        cached = self._cached_response(prompt)
+        if cached is not None:
+            return cached
+
+        self._RATE_LIMITER.acquire(self.request_interval)
         logger.info("Sending prompt to the generative model.")
         try:
             response = self.model.generate_content(prompt)
@@ -54,9 +165,95 @@ class ContentGenerator:
                 return None
 
         logger.info("Generated content successfully.")
-        # Wait to respect request interval (helps avoid rate limits)
-        time.sleep(self.request_interval)
+        text = self._response_text(response)
+        self._store_response(prompt, text)
+        return text
+
+    def stream_content(self, prompt):
+        """
+        Generate content like generate_content, yielding text chunks as the model produces them.
+        Errors 500/503 raised before the first chunk are retried once after 1 minute; any other
+        failure, or one after output has started, raises GenerationError so the caller can tell
+        a partial response from a complete one.
+
+        :param prompt: A string prompt for the model.
+        :return: Iterator over the generated text chunks.
+        :raises GenerationError: If the response could not be generated completely.
+        """
+        cached = self._cached_response(prompt)
+        if cached is not None:
+            yield cached
+            return
+
+        self._RATE_LIMITER.acquire(self.request_interval)
+        logger.info("Streaming prompt to the generative model.")
+        chunks = []
+        try:
+            yield from self._stream_chunks(prompt, chunks)
+        except Exception as e:
+            excpt = str(e)
+            if chunks or not ('500' in excpt or '503' in excpt):
+                logger.error(f"Error generating content: {e}")
+                raise GenerationError(excpt) from e
+            logger.warning(f"Error 500/503 encountered, retrying in 1 minute: {excpt}")
+            time.sleep(60)  # Wait for 1 minute before retrying
+            try:
+                yield from self._stream_chunks(prompt, chunks)
+            except Exception as retry_e:
+                logger.error(f"Retry failed: {retry_e}")
+                raise GenerationError(str(retry_e)) from retry_e
+
+        if not chunks:
+            logger.error("Generated response contained no text.")
+            raise GenerationError("Generated response contained no text.")
+
+        logger.info("Generated content successfully.")
+        self._store_response(prompt, "".join(chunks))
+
+    def _stream_chunks(self, prompt, chunks):
+        """Yield the text of each streamed response chunk, also appending it to chunks."""
+        for chunk in self.model.generate_content(prompt, stream=True):
+            text = self._response_text(chunk)
+            if text:
+                chunks.append(text)
+                yield text
+
+    async def agenerate_content(self, prompt):
+        """
+        Asynchronous variant of generate_content, so several prompts can be in flight at once.
+
+        :param prompt: A string prompt for the model.
+        :return: The generated text, or None on failure.
+        """
+        cached = self._cached_response(prompt)
+        if cached is not None:
+            return cached
+
+        await self._RATE_LIMITER.aacquire(self.request_interval)
+        logger.info("Sending prompt to the generative model.")
+        try:
+            response = await self.model.generate_content_async(prompt)
+        except Exception as e:
+            excpt = str(e)
+            if '500' in excpt or '503' in excpt:
+                logger.warning(f"Error 500/503 encountered, retrying in 1 minute: {excpt}")
+                await asyncio.sleep(60)  # Wait for 1 minute before retrying
+                try:
+                    response = await self.model.generate_content_async(prompt)
+                except Exception as retry_e:
+                    logger.error(f"Retry failed: {retry_e}")
+                    return None
+            else:
+                logger.error(f"Error generating content: {e}")
+                return None
+
+        logger.info("Generated content successfully.")
+        text = self._response_text(response)
+        self._store_response(prompt, text)
+        return text
 
+    def _response_text(self, response):
+        """Extract the text from a model response, or None if it has none."""
         try:
             return response.text
         except ValueError as ve:
@@ -1,92 +1,349 @@
+import asyncio
+import re
+import time
+from io import StringIO
+import aiohttp
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import numpy as np
 import pandas as pd
 from bs4 import BeautifulSoup
+from lxml import etree
 import yfinance as yf
-import ta
 import logging
+from Cache import FileCache
+
+try:
+    import talib
+except ImportError:  # fall back to the NumPy helpers below
+    talib = None
 
 # Configure logger
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Cache lifetimes (seconds) for each network source
+PRICE_TTL = 24 * 60 * 60
+NEWS_TTL = 24 * 60 * 60
+SCREENER_TTL = 7 * 24 * 60 * 60
+
+# Number of most recent quarters/years kept from each financial table
+TABLE_PERIODS = 5
+
+REQUEST_TIMEOUT = 10
+# Transient HTTP statuses retried with exponential backoff, for both HTTP clients
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+MAX_RETRIES = 3
+BACKOFF_FACTOR = 0.5
+# Technical analysis result when no price history could be fetched
+TA_FETCH_FAILED = "Data fetch failed. Check the stock symbol."
+# Screener.in key ratios derived from the live price; dropped when the page is stale
+_PRICE_PROPERTIES = ("Market Cap", "Stock P/E", "High / Low", "Dividend Yield")
+# Errors raised for a failed page fetch (other exceptions are bugs and are re-raised)
+_FETCH_ERRORS = (aiohttp.ClientError, asyncio.TimeoutError)
+HEADERS = {
+    'Accept-Encoding': 'gzip',
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+                  '(KHTML, like Gecko) Chrome/120.0 Safari/537.36',
+}
+
+
+def _build_session():
+    """
+    Create a pooled requests session that retries transient failures.
+
+    :return: Configured requests.Session.
+    """
+    session = requests.Session()
+    retry = Retry(total=MAX_RETRIES, backoff_factor=BACKOFF_FACTOR, status_forcelist=RETRY_STATUSES)
+    session.mount("https://", HTTPAdapter(pool_connections=8, pool_maxsize=16, max_retries=retry))
+    return session
+
+# Compiled once and reused for every Screener.in page
+_HTML_PARSER = etree.HTMLParser()
+_PROPERTY_NAME = etree.XPath(".//span[contains(concat(' ', normalize-space(@class), ' '), ' name ')]")
+_PROPERTY_VALUE = etree.XPath(".//span[@class='nowrap value']")
+
+# Screener.in elements collected in a single document-order walk
+_PAGE_TAGS = ("h1", "div", "li", "table")
+_STOCK_NAME_CLASS = "h2 shrink-text"
+_PROPERTY_CLASS = "flex flex-space-between"
+_FINANCIAL_TABLE_CLASS = "data-table responsive-text-nowrap"
+_SHAREHOLDING_TOKEN = "data-table"
+# div class attribute (exact match) -> part name
+_DIV_CLASSES = {
+    "flex flex-align-center": "stock_info",
+    "sub show-more-box about": "about",
+    "sub commentary always-show-more-box": "key",
+}
+# div class token (any match) -> part name
+_DIV_TOKENS = (("pros", "pros"), ("cons", "cons"), ("sub", "sector"))
+
+# Indentation runs left inside values such as "₹\n        1,234 Cr."
+_WS_RE = re.compile(r'\s{2,}')
+
+
+def _closes_key(stock, period="1y", interval="1d"):
+    """FileCache key for a stock's closing-price vector."""
+    return (stock, "close", {"period": period, "interval": interval})
+
+
+def _to_number(value):
+    """Convert a numeric string ("1,234", "5.6") to a number, leaving other values as they are."""
+    try:
+        number = float(str(value).replace(",", ""))
+    except ValueError:
+        return value
+    return int(number) if number.is_integer() else number
+
+
+def _text(el):
+    """Stripped text content of an lxml element, or "" if it is missing."""
+    return "".join(el.itertext()).strip() if el is not None else ""
+
+
+def _sma_tail(a, n):
+    """Simple moving average of the last n values."""
+    return float(a[-n:].mean())
+
+
+def _ema_series(a, n):
+    """
+    Exponential moving average (alpha = 2 / (n + 1)) seeded from the first value.
+
+    :param a: Sequence of prices.
+    :param n: EMA period.
+    :return: List with the EMA at every position of a.
+    """
+    alpha = 2 / (n + 1)
+    values = a.tolist() if isinstance(a, np.ndarray) else list(a)
+    ema = values[0]
+    out = [ema]
+    for x in values[1:]:
+        ema += alpha * (x - ema)
+        out.append(ema)
+    return out
+
+
+def _ema_last(a, n, lookback=4):
+    """
+    Latest EMA value, computed over only the last lookback * n samples,
+    which is enough for the seed to have decayed away.
+    """
+    return _ema_series(a[-lookback * n:], n)[-1]
+
+
+def _rsi_last(a, n=14):
+    """
+    Latest RSI value using Wilder's smoothing, seeded like TA-Lib with the mean
+    of the first n changes. The whole series is smoothed: the seed decays
+    slowly ((n-1)/n per step), so a short tail would bias the result.
+    """
+    deltas = np.diff(a)
+    gains = np.clip(deltas, 0, None).tolist()
+    losses = np.clip(-deltas, 0, None).tolist()
+    if len(gains) < n:
+        return float("nan")
+
+    avg_gain = sum(gains[:n]) / n
+    avg_loss = sum(losses[:n]) / n
+    for gain, loss in zip(gains[n:], losses[n:]):
+        avg_gain = (avg_gain * (n - 1) + gain) / n
+        avg_loss = (avg_loss * (n - 1) + loss) / n
+
+    if avg_loss == 0:
+        return 100.0
+    return 100 - 100 / (1 + avg_gain / avg_loss)
+
+
+def _latest_indicators(close):
+    """
+    Latest value of every indicator used by the technical analysis.
+
+    Uses TA-Lib when it is installed, otherwise the helpers above: Bollinger
+    Bands, EMA and MACD are computed over a tail window of the series, while
+    RSI is smoothed over the whole series. The EMA and RSI recurrences are
+    plain Python loops over lists rather than vectorised NumPy.
+
+    :param close: float64 array of closing prices, oldest first.
+    :return: Dictionary of indicator name to its latest value.
+    """
+    if talib is not None:
+        macd_line, macd_signal, _ = talib.MACD(close)
+        bb_upper, _, bb_lower = talib.BBANDS(close, 20, 2, 2)
+        return {
+            "rsi": talib.RSI(close, timeperiod=14)[-1],
+            "macd_line": macd_line[-1],
+            "macd_signal": macd_signal[-1],
+            "bb_upper": bb_upper[-1],
+            "bb_lower": bb_lower[-1],
+            "ema_20": talib.EMA(close, timeperiod=20)[-1],
+            "ema_50": talib.EMA(close, timeperiod=50)[-1],
+        }
+
+    window = close[-(4 * 26 + 4 * 9):]
+    macd = [fast - slow for fast, slow in zip(_ema_series(window, 12), _ema_series(window, 26))]
+    bb_window = close[-20:]
+    bb_mid, bb_std = bb_window.mean(), bb_window.std()
+    return {
+        "rsi": _rsi_last(close, 14),
+        "macd_line": macd[-1],
+        "macd_signal": _ema_series(macd, 9)[-1],
+        "bb_upper": float(bb_mid + 2 * bb_std),
+        "bb_lower": float(bb_mid - 2 * bb_std),
+        "ema_20": _ema_last(close, 20),
+        "ema_50": _ema_last(close, 50),
+    }
+
+
+async def _fetch(session, url):
+    """
+    Fetch a URL with an aiohttp session, retrying transient statuses
+    (RETRY_STATUSES) up to MAX_RETRIES times with exponential backoff.
+
+    :param session: aiohttp.ClientSession to issue the request on.
+    :param url: URL to fetch.
+    :return: Decoded response body.
+    """
+    for attempt in range(MAX_RETRIES + 1):
+        async with session.get(url) as response:
+            if response.status not in RETRY_STATUSES or attempt == MAX_RETRIES:
+                response.raise_for_status()
+                return await response.text()
+            delay = BACKOFF_FACTOR * 2 ** attempt
+            logger.warning("HTTP %d from %s, retrying in %.1fs", response.status, url, delay)
+        await asyncio.sleep(delay)
+
+
 class StockScraper:
     """
     Scrapes stock-related data from web sources.
     """
 
-    def __init__(self, company, exchange="NSE"):
+    # (fetch time, closing prices) prefetched by prefetch_history, keyed by
+    # stock symbol. Entries are consumed by the first _load_closes call.
+    _HIST_CACHE = {}
+
+    # Shared HTTP session so connections are kept alive across requests.
+    _SESSION = _build_session()
+
+    def __init__(self, company, exchange="NSE", cache=None):
         """
         Initialize the scraper with a company symbol and exchange.
+
+        :param cache: FileCache used for network responses; a default one
+                      under .cache/ is created if omitted.
         """
         self.stock = company.upper()
         self.exchange = exchange.upper()
+        self.cache = cache if cache is not None else FileCache()
 
-    def table_to_json(self, table):
+    def table_to_json(self, table, max_periods=TABLE_PERIODS):
         """
         Convert an HTML table to a JSON format using pandas.
 
-        :param table: BeautifulSoup table element.
+        :param table: lxml table element.
+        :param max_periods: Number of most recent columns to keep.
         :return: JSON string.
         """
-        headers = [th.text.strip() for th in table.find_all('th')]
-        rows = table.find_all('tr')[1:]
+        df = pd.read_html(StringIO(etree.tostring(table, encoding="unicode")), index_col=0)[0]
+        df = df.iloc[:, -max_periods:].apply(lambda col: col.map(_to_number))
+        return df.to_json(orient='index')
 
-        data = [
-            {headers[i + 1]: td.text.strip() for i, td in enumerate(row.find_all('td')[1:])}
-            for row in rows
+    @classmethod
+    def prefetch_history(cls, tickers, period="1y", interval="1d", cache=None):
+        """
+        Download price history for several stocks in a single request and
+        keep it for later technical_analysis calls. Stocks whose closes are
+        still fresh in the file cache are skipped.
+
+        :param tickers: Iterable of company symbols.
+        :param period: History period passed to yfinance.
+        :param interval: Candle interval passed to yfinance.
+        :param cache: FileCache to check; a default one under .cache/ is used if omitted.
+        """
+        cache = cache if cache is not None else FileCache()
+        stocks = [
+            t.upper() for t in tickers
+            if cache.get_array(_closes_key(t.upper(), period, interval), PRICE_TTL) is None
         ]
-        index = [row.find('td').text.strip() for row in rows]
-        df = pd.DataFrame(data, index=index)
-        return df.to_json(orient='index')
+        if not stocks:
+            return
+
+        symbols = " ".join(f"{t}.NS" for t in stocks)
+        logger.info("Prefetching price history for %d tickers", len(stocks))
+        df = yf.download(symbols, period=period, interval=interval, group_by="ticker", threads=True,
+                         auto_adjust=True, actions=False, session=cls._SESSION)
+
+        for stock in stocks:
+            tick = f"{stock}.NS"
+            if isinstance(df.columns, pd.MultiIndex):
+                if tick not in df.columns.get_level_values(0):
+                    continue
+                frame = df[tick]
+            else:
+                frame = df
+            closes = frame['Close'].dropna().to_numpy(dtype=np.float32)
+            if closes.size:
+                cls._HIST_CACHE[stock] = (time.time(), closes)
+
+    def _load_closes(self):
+        """
+        Load one year of daily closing prices, preferring prefetched history.
+
+        :return: float32 array of closing prices, or None if no data was returned.
+        """
+        fetched_at, closes = self._HIST_CACHE.pop(self.stock, (0, None))
+        if closes is None or time.time() - fetched_at >= PRICE_TTL:
+            ticker = yf.Ticker(f"{self.stock}.NS", session=self._SESSION)
+            df = ticker.history(period="1y", interval="1d", auto_adjust=True, actions=False)[['Close']]
+            closes = df['Close'].dropna().to_numpy(dtype=np.float32)
+        return closes if closes.size else None
 
     def technical_analysis(self):
         """
         Perform technical analysis for a 3-month holding period.
         """
         tick = f"{self.stock}.NS"
-        df = yf.download(tick, period="1y", interval="1d")
+        closes = self.cache.get_or_fetch(
+            _closes_key(self.stock), PRICE_TTL, self._load_closes, array=True
+        )
 
-        if df.empty:
+        if closes is None:
             logger.error("Data fetch failed for ticker: %s", tick)
-            return "Data fetch failed. Check the stock symbol."
+            return TA_FETCH_FAILED
+
+        close = np.asarray(closes, dtype=np.float64)
 
         signals = []
 
+        indicators = _latest_indicators(close)
+
         # Simple Moving Averages
-        df['SMA_50'] = df['Close'].rolling(window=50).mean()
-        df['SMA_100'] = df['Close'].rolling(window=100).mean()
-        signals.append(1 if df['SMA_50'].iloc[-1] > df['SMA_100'].iloc[-1] else -1)
+        signals.append(1 if _sma_tail(close, 50) > _sma_tail(close, 100) else -1)
 
         # Relative Strength Index
-        df['RSI'] = ta.momentum.RSIIndicator(df['Close'], window=14).rsi()
-        if df['RSI'].iloc[-1] > 70:
+        if indicators["rsi"] > 70:
             signals.append(-1)
-        elif df['RSI'].iloc[-1] < 30:
+        elif indicators["rsi"] < 30:
             signals.append(1)
         else:
             signals.append(0)
 
         # MACD
-        macd = ta.trend.MACD(df['Close'])
-        df['MACD_line'] = macd.macd()
-        df['MACD_signal'] = macd.macd_signal()
-        signals.append(1 if df['MACD_line'].iloc[-1] > df['MACD_signal'].iloc[-1] else -1)
+        signals.append(1 if indicators["macd_line"] > indicators["macd_signal"] else -1)
 
         # Bollinger Bands
-        bb = ta.volatility.BollingerBands(df['Close'], window=20, window_dev=2)
-        df['BB_upper'] = bb.bollinger_hband()
-        df['BB_lower'] = bb.bollinger_lband()
-        if df['Close'].iloc[-1] < df['BB_lower'].iloc[-1]:
+        if close[-1] < indicators["bb_lower"]:
             signals.append(1)
-        elif df['Close'].iloc[-1] > df['BB_upper'].iloc[-1]:
+        elif close[-1] > indicators["bb_upper"]:
             signals.append(-1)
         else:
             signals.append(0)
 
         # Exponential Moving Averages
-        df['EMA_20'] = ta.trend.EMAIndicator(df['Close'], window=20).ema_indicator()
-        df['EMA_50'] = ta.trend.EMAIndicator(df['Close'], window=50).ema_indicator()
-        signals.append(1 if df['EMA_20'].iloc[-1] > df['EMA_50'].iloc[-1] else -1)
+        signals.append(1 if indicators["ema_20"] > indicators["ema_50"] else -1)
 
         # Weighted Voting
         weights = [0.3, 0.2, 0.2, 0.2, 0.1]
@@ -98,24 +355,52 @@ class StockScraper:
             return "Sell"
         return "Hold"
 
+    @property
+    def news_url(self):
+        """Google Finance quote page for the stock."""
+        return f"https://www.google.com/finance/quote/{self.stock}:{self.exchange}?hl=en"
+
+    @property
+    def properties_url(self):
+        """Screener.in company page for the stock."""
+        return f'https://www.screener.in/company/{self.stock}'
+
+    @property
+    def _news_key(self):
+        """FileCache key for the Google Finance page."""
+        return (self.stock, "news", {"exchange": self.exchange})
+
     def get_stock_news(self):
         """
         Fetch latest news from Google Finance.
 
         :return: Dictionary of news with timestamps or error message.
         """
-        url = f"https://www.google.com/finance/quote/{self.stock}:{self.exchange}?hl=en"
+        url = self.news_url
         logger.info("Fetching news from %s", url)
 
-        try:
-            response = requests.get(url)
+        def load():
+            response = self._SESSION.get(url, headers=HEADERS, timeout=REQUEST_TIMEOUT)
             response.raise_for_status()
+            return response.text
+
+        try:
+            html = self.cache.get_or_fetch(self._news_key, NEWS_TTL, load)
             logger.info("News fetched successfully.")
         except requests.RequestException as e:
             logger.error("Error fetching news: %s", e)
             return {"error": str(e)}
 
-        page = BeautifulSoup(response.content, "html.parser")
+        return self._parse_news(html)
+
+    def _parse_news(self, html):
+        """
+        Extract news headlines and their timestamps from a Google Finance page.
+
+        :param html: Raw HTML of the quote page.
+        :return: Dictionary of news with timestamps.
+        """
+        page = BeautifulSoup(html, "lxml")
         news_items = page.find_all("div", class_="Yfwt5")
         times = page.find_all("div", class_="Adak")
 
@@ -126,56 +411,206 @@ class StockScraper:
 
         return news
 
+    def _parse_page(self, html):
+        """
+        Collect the parts of a Screener.in page needed by get_stock_properties
+        in a single pass over the document.
+
+        :param html: Raw HTML of the company page.
+        :return: Dictionary with the first element found for each part, plus
+                 "properties" (key ratios dict) and "tables" (financial tables).
+        """
+        parts = {"properties": {}, "tables": []}
+        tree = etree.HTML(html, _HTML_PARSER)
+        if tree is None:
+            return parts
+
+        props = parts["properties"]
+        tables = parts["tables"]
+        ws_sub = _WS_RE.sub
+
+        for el in tree.iter(*_PAGE_TAGS):
+            cls = el.get("class", "")
+            tag = el.tag
+            if tag == "li":
+                if cls != _PROPERTY_CLASS:
+                    continue
+                names = _PROPERTY_NAME(el)
+                if not names:
+                    continue
+                values = _PROPERTY_VALUE(el)
+                if not values:
+                    continue
+                props[_text(names[0])] = ws_sub('', _text(values[0]))
+            elif tag == "div":
+                tokens = cls.split()
+                if cls in _DIV_CLASSES:
+                    parts.setdefault(_DIV_CLASSES[cls], el)
+                for token, name in _DIV_TOKENS:
+                    if token in tokens:
+                        parts.setdefault(name, el)
+            elif tag == "table":
+                if cls == _FINANCIAL_TABLE_CLASS:
+                    tables.append(el)
+                if _SHAREHOLDING_TOKEN in cls.split():
+                    parts.setdefault("shareholding", el)
+            elif cls == _STOCK_NAME_CLASS:
+                parts.setdefault("stock_name", el)
+
+        return parts
+
+    async def _cached_fetch(self, session, key, url, ttl):
+        """
+        Fetch a URL through the file cache.
+
+        :param session: aiohttp.ClientSession used on a cache miss.
+        :param key: FileCache key for the page.
+        :param url: URL to fetch.
+        :param ttl: Maximum age of a cached page in seconds.
+        :return: Page HTML.
+        """
+        html = self.cache.get(key, ttl)
+        if html is None:
+            html = await _fetch(session, url)
+            self.cache.set(key, html)
+        return html
+
+    async def _fetch_page_data(self, session):
+        """
+        Fetch the Screener.in page and extract its data in a worker thread,
+        so parsing overlaps with the other requests still in flight. A freshly
+        fetched page is only cached once it is known to contain the stock name,
+        so challenge or not-found pages are not kept.
+
+        :return: Tuple of (page data, page age in seconds).
+        """
+        key = (self.stock, "screener")
+        html, age = self.cache.get_with_age(key, SCREENER_TTL)
+        fetched = html is None
+        if fetched:
+            html, age = await _fetch(session, self.properties_url), 0
+        data = await asyncio.to_thread(self._page_data, html)
+        if fetched and "error" not in data:
+            self.cache.set(key, html)
+        return data, age
+
+    async def _fetch_news(self, session):
+        """
+        Fetch the Google Finance page and extract its news in a worker thread.
+        """
+        html = await self._cached_fetch(session, self._news_key, self.news_url, NEWS_TTL)
+        return await asyncio.to_thread(self._parse_news, html)
+
+    async def get_all(self):
+        """
+        Fetch and parse the Screener.in and Google Finance pages and run the
+        technical analysis concurrently.
+
+        :return: Tuple of (page_data, news, technical_signal). Failed steps
+                 are returned as the raised exception.
+        """
+        logger.info("Fetching stock properties from %s", self.properties_url)
+        logger.info("Fetching news from %s", self.news_url)
+        timeout = aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
+        async with aiohttp.ClientSession(headers=HEADERS, timeout=timeout) as session:
+            return await asyncio.gather(
+                self._fetch_page_data(session),
+                self._fetch_news(session),
+                asyncio.to_thread(self.technical_analysis),
+                return_exceptions=True,
+            )
+
     def get_stock_properties(self):
         """
         Scrape stock properties from Screener.in.
 
         :return: Dictionary of stock data or error message.
         """
-        url = f'https://www.screener.in/company/{self.stock}'
-        logger.info("Fetching stock properties from %s", url)
+        page_data, news, technical_signal = asyncio.run(self.get_all())
+
+        for result in (page_data, news, technical_signal):
+            if isinstance(result, Exception) and not isinstance(result, _FETCH_ERRORS):
+                raise result
+
+        if isinstance(page_data, Exception):
+            logger.error("Error fetching stock properties: %s", page_data)
+            return {"error": str(page_data)}
+        page_data, page_age = page_data
+        if "error" in page_data:
+            return page_data
+        if page_age >= PRICE_TTL:
+            self._refresh_quote(page_data)
+
+        if isinstance(news, Exception):
+            logger.error("Error fetching news: %s", news)
+            news = {"error": str(news)}
+        else:
+            logger.info("News fetched successfully.")
 
-        try:
-            response = requests.get(url)
-            response.raise_for_status()
-        except requests.RequestException as e:
-            logger.error("Error fetching stock properties: %s", e)
-            return {"error": str(e)}
+        if isinstance(technical_signal, Exception):
+            logger.error("Error fetching price history: %s", technical_signal)
+            technical_signal = TA_FETCH_FAILED
 
-        page = BeautifulSoup(response.content, 'html.parser')
+        page_data["news"] = news
+        page_data["technical_analysis"] = technical_signal
+        return page_data
 
-        try:
-            stock_name = page.find('h1', class_='h2 shrink-text').text.strip()
-        except AttributeError:
+    def _refresh_quote(self, data):
+        """
+        Bring the price-dependent fields of a cached Screener.in page, which may
+        be up to SCREENER_TTL old, in line with the latest close: the price,
+        daily change and "Current Price" ratio are replaced, and the ratios
+        derived from the price (market cap, P/E, 52-week range, dividend
+        yield) are dropped rather than reported stale.
+
+        :param data: Page data to update in place.
+        """
+        props = data["properties"]
+        for name in _PRICE_PROPERTIES:
+            props.pop(name, None)
+
+        closes = self.cache.get_or_fetch(_closes_key(self.stock), PRICE_TTL, self._load_closes, array=True)
+        if closes is None or len(closes) < 2:
+            logger.warning("No recent close for %s; price is from a cached page.", self.stock)
+            return
+        price, previous = float(closes[-1]), float(closes[-2])
+        data["stock_price"] = f"₹ {price:,.2f}"
+        data["stock_change"] = f"{(price / previous - 1) * 100:+.2f}%"
+        if "Current Price" in props:
+            props["Current Price"] = data["stock_price"]
+        logger.info("Using latest close for the price of %s.", self.stock)
+
+    def _page_data(self, html):
+        """
+        Extract stock properties from a Screener.in page.
+
+        :param html: Raw HTML of the company page.
+        :return: Dictionary of stock data, with "news" and "technical_analysis"
+                 left as None for the caller to fill, or an error message.
+        """
+        parts = self._parse_page(html)
+
+        if "stock_name" not in parts:
             logger.error("Stock name not found.")
             return {"error": "Stock name not found."}
+        stock_name = _text(parts["stock_name"])
 
-        stock_info = page.find('div', class_='flex flex-align-center')
+        stock_info = parts.get("stock_info")
         stock_price, stock_change = ("", "")
-        if stock_info and stock_info.find_all('span'):
-            spans = stock_info.find_all('span')
-            stock_price, stock_change = spans[0].text.strip(), spans[1].text.strip()
-
-        about = page.find('div', class_='sub show-more-box about')
-        key = page.find('div', class_='sub commentary always-show-more-box')
-        about_text = about.text.strip() if about else ""
-        key_text = key.text.strip() if key else ""
-
-        props = {
-            pt.find('span', class_='name').text.strip(): pt.find('span', class_='nowrap value').text.strip().replace('\n        ', '')
-            for pt in page.find_all('li', class_='flex flex-space-between')
-            if pt.find('span', class_='name') and pt.find('span', class_='nowrap value')
-        }
+        spans = list(stock_info.iter("span")) if stock_info is not None else []
+        if len(spans) > 1:
+            stock_price, stock_change = _text(spans[0]), _text(spans[1])
+
+        about_text = _text(parts.get("about"))
+        key_text = _text(parts.get("key"))
 
-        pros = page.find('div', class_='pros')
-        cons = page.find('div', class_='cons')
-        sector = page.find('div', class_='sub')
+        props = parts["properties"]
 
-        pros_text = pros.text.strip() if pros else ""
-        cons_text = cons.text.strip() if cons else ""
-        sector_text = sector.text.strip() if sector else ""
+        pros_text = _text(parts.get("pros"))
+        cons_text = _text(parts.get("cons"))
+        sector_text = _text(parts.get("sector"))
 
-        tables = page.find_all('table', class_='data-table responsive-text-nowrap')
+        tables = parts["tables"]
         financial_data = {
             "quarterly_results": self.table_to_json(tables[0]) if len(tables) > 0 else "",
             "profit_and_loss": self.table_to_json(tables[1]) if len(tables) > 1 else "",
@@ -184,14 +619,14 @@ class StockScraper:
             "debtors_ratio": self.table_to_json(tables[4]) if len(tables) > 4 else "",
         }
 
-        shareholding_table = page.find('table', class_='data-table')
-        shareholding = self.table_to_json(shareholding_table) if shareholding_table else ""
+        shareholding_table = parts.get("shareholding")
+        shareholding = self.table_to_json(shareholding_table) if shareholding_table is not None else ""
 
         data = {
             "stock_name": stock_name,
             "stock_price": stock_price,
             "stock_change": stock_change,
-            "news": self.get_stock_news(),
+            "news": None,
             "about": about_text,
             "key": key_text,
             "properties": props,
@@ -200,7 +635,7 @@ class StockScraper:
             "sector": sector_text,
             **financial_data,
             "shareholding_pattern": shareholding,
-            "technical_analysis": self.technical_analysis()
+            "technical_analysis": None
         }
 
         return data
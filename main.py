@@ -1,24 +1,46 @@
 import streamlit as st
+import asyncio
 import os
 import logging
 import google.generativeai as genai
 from Analysis import StockAnalysisPipeline
+from Content import ContentGenerator, GenerationError
 import pandas as pd
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+@st.cache_data
+def load_symbols():
+    """Read the list of company symbols once; Streamlit reuses it across reruns."""
+    symbols = pd.read_csv("stock.csv", usecols=["Symbol"], dtype={"Symbol": "category"})["Symbol"]
+    return sorted(symbols.cat.categories.tolist())
+
+@st.cache_resource
+def load_generator(api_key):
+    """Build the content generator once per API key and share it across reruns and sessions."""
+    return ContentGenerator(genai=genai, api_key=api_key)
+
 def main():
     st.set_page_config(page_title="Stock Nav", layout="wide")
     st.title("📈 Stock Nav")
     st.subheader("Analyze stock data and generate detailed insights.")
     
     st.sidebar.title("🔍 Company Symbol")
-    stock_data = pd.read_csv("stock.csv")
-    suggestions = sorted(stock_data["Symbol"].unique())
-    company_symbol = st.sidebar.selectbox("Enter company symbol", suggestions)
+    suggestions = load_symbols()
+    company_symbols = st.sidebar.multiselect("Enter company symbols", suggestions, default=suggestions[:1])
 
     if st.sidebar.button("Run Analysis"):
+        if not company_symbols:
+            st.error("Select at least one company symbol.")
+            return
+
+        api_key = os.getenv('GENAI_API_KEY')
+        if not api_key:
+            st.error("GENAI_API_KEY is not set. Please configure it and try again.")
+            return
+        generator = load_generator(api_key)
+
         progress_bar = st.progress(0)
         status_text = st.empty()
 
@@ -27,23 +49,36 @@ def main():
             progress_bar.progress(progress)
             status_text.text(f"Processing... {int(progress * 100)}%")
 
-        with st.spinner("🔄 Analyzing... Average wait time: 01 Min"):
+        if len(company_symbols) == 1:
             pipeline = StockAnalysisPipeline(
-                company=company_symbol,
-                genai=genai,
-                api_key = os.getenv('GENAI_API_KEY'),
-                exchange="NSE"
+                company=company_symbols[0],
+                exchange="NSE",
+                generator=generator
             )
-            pipeline.run_pipeline(progress_callback=update_progress)
-        
-        st.success(f"✅ Analysis completed for {company_symbol}")
-        
-        try:
-            with open(f"C{company_symbol}_analysis.md", "r", encoding="utf-8") as md_file:
-                st.markdown(md_file.read())
-
-        except FileNotFoundError:
-            st.error("Markdown file not found. Please check if the pipeline generated it.")
+            try:
+                with st.spinner("🔄 Analyzing... Average wait time: 01 Min"):
+                    md_text = st.write_stream(pipeline.stream_pipeline(progress_callback=update_progress))
+            except GenerationError:
+                st.error(f"Analysis failed for {company_symbols[0]} before the report was complete. "
+                         "Please check the logs for details.")
+                return
+
+            if md_text:
+                st.success(f"✅ Analysis completed for {company_symbols[0]}")
+            else:
+                st.error(f"Analysis failed for {company_symbols[0]}. Please check the logs for details.")
+            return
+
+        with st.spinner("🔄 Analyzing... Average wait time: 01 Min"):
+            results = asyncio.run(StockAnalysisPipeline.run_batch(company_symbols, exchange="NSE", generator=generator))
+            update_progress(1, 1)
+
+        for company_symbol, md_text in zip(company_symbols, results):
+            if md_text:
+                st.success(f"✅ Analysis completed for {company_symbol}")
+                st.markdown(md_text)
+            else:
+                st.error(f"Analysis failed for {company_symbol}. Please check the logs for details.")
 
 if __name__ == "__main__":
     main()